@@ -146,6 +146,19 @@ class DialogueConnector:
             utterance_feedback, utterance_id
         )
 
+    def handle_feedback(self, utterance_id: str, value: int) -> None:
+        """Registers user's feedback received from the platform.
+
+        Args:
+            utterance_id: Utterance ID.
+            value: Feedback value, positive if greater than zero and negative
+              otherwise.
+        """
+        feedback = (
+            BinaryFeedback.POSITIVE if value > 0 else BinaryFeedback.NEGATIVE
+        )
+        self.register_user_feedback(feedback, utterance_id)
+
     def start(self) -> None:
         """Starts the conversation."""
         self._agent.welcome()
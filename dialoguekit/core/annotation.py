@@ -3,8 +3,10 @@
 from dataclasses import dataclass, field
 from typing import Optional
 
+from dialoguekit.core.dataclass_slots import DATACLASS_SLOTS
 
-@dataclass(eq=True, unsafe_hash=True)
+
+@dataclass(eq=True, unsafe_hash=True, **DATACLASS_SLOTS)
 class Annotation:
     """Represents an annotation."""
 
@@ -0,0 +1,12 @@
+"""Keyword arguments for declaring slotted dataclasses.
+
+`dataclasses.dataclass` only accepts `slots=True` from Python 3.10; on older
+versions the dataclasses keep their per-instance `__dict__`.
+"""
+
+import sys
+from typing import Any, Dict
+
+DATACLASS_SLOTS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
@@ -1,10 +1,18 @@
 """Interface representing an intent."""
 
 
-from typing import Any, List, Optional, Text, Union
+import sys
+from typing import Any, Dict, List, Optional, Text, Union
+
+
+def _intern_label(label: Any) -> Any:
+    """Interns an intent label if it is a string."""
+    return sys.intern(label) if isinstance(label, str) else label
 
 
 class Intent:
+    __slots__ = ("_label", "_hash", "_main_intent", "_sub_intents")
+
     def __init__(
         self, label: str, main_intent: Optional[Union[None, Any]] = None
     ) -> None:
@@ -14,7 +22,10 @@ class Intent:
             label: Intent label.
             main_intent: The main_intent intent.
         """
-        self._label = label
+        # Labels are interned, so that equal labels are the same object and
+        # compare by identity.
+        self._label = _intern_label(label)
+        self._hash = hash(label)
         self._main_intent = main_intent
         if self._main_intent:
             self._main_intent._add_sub_intent(sub_intent=self)
@@ -28,10 +39,27 @@ class Intent:
         return f"Intent({self._label})"
 
     def __hash__(self) -> int:
-        return hash(self._label)
+        return self._hash
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            "_label": self._label,
+            "_main_intent": self._main_intent,
+            "_sub_intents": self._sub_intents,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._label = _intern_label(self._label)
+        # String hashes are salted per process, so the cached hash is
+        # recomputed when unpickling.
+        self._hash = hash(self._label)
 
     def __eq__(self, __o: object) -> bool:
         """Comparison function."""
+        if self is __o:
+            return True
         if not isinstance(__o, Intent):
             return False
         if self._label != __o._label:
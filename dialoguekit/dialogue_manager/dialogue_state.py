@@ -1,19 +1,135 @@
-from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Any, Iterator, List, Mapping, Optional, Sequence, Tuple
 
 from dialoguekit.core.annotated_utterance import AnnotatedUtterance
 from dialoguekit.core.annotation import Annotation
+from dialoguekit.core.dataclass_slots import DATACLASS_SLOTS
 from dialoguekit.core.intent import Intent
 
 
-@dataclass
+class HistoryView(Sequence[AnnotatedUtterance]):
+    """Read-only view of the utterances in a dialogue history.
+
+    The view only exposes the utterances up to `stop`, so a view of an
+    append-only list is not affected by later appends. The view compares
+    equal to any sequence holding the same utterances.
+    """
+
+    __slots__ = ("_history", "_stop")
+
+    def __init__(
+        self,
+        history: Sequence[AnnotatedUtterance],
+        stop: Optional[int] = None,
+    ) -> None:
+        """Initializes the view.
+
+        Args:
+            history: Utterances to expose.
+            stop: Number of utterances to expose. Defaults to None (all
+              utterances in the history).
+        """
+        self._history = history
+        self._stop = len(history) if stop is None else stop
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._stop)
+            # A negative stop means slicing backwards past the first item.
+            return self._history[start : stop if stop >= 0 else None : step]
+        if index < 0:
+            index += self._stop
+        if not 0 <= index < self._stop:
+            raise IndexError("history index out of range")
+        return self._history[index]
+
+    def __len__(self) -> int:
+        return self._stop
+
+    def __iter__(self) -> Iterator[AnnotatedUtterance]:
+        return islice(self._history, self._stop)
+
+    def __eq__(self, __o: object) -> bool:
+        if not isinstance(__o, Sequence) or isinstance(__o, str):
+            return NotImplemented
+        return len(self) == len(__o) and all(
+            utterance == other for utterance, other in zip(self, __o)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return HistoryView, (list(self),)
+
+    def __repr__(self) -> str:
+        return f"HistoryView({list(self)!r})"
+
+
+class SlotsView(Mapping[str, Tuple[Annotation, ...]]):
+    """Read-only view of the annotations per slot in a dialogue state.
+
+    The view compares equal to any mapping holding the same annotations.
+    Unlike `types.MappingProxyType`, it can be copied and pickled.
+    """
+
+    __slots__ = ("_slots",)
+
+    def __init__(self, slots: Mapping[str, Tuple[Annotation, ...]]) -> None:
+        """Initializes the view.
+
+        Args:
+            slots: Annotations per slot to expose.
+        """
+        self._slots = slots
+
+    def __getitem__(self, slot: str) -> Tuple[Annotation, ...]:
+        return self._slots[slot]
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._slots)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return SlotsView, (dict(self._slots),)
+
+    def __repr__(self) -> str:
+        return f"SlotsView({dict(self._slots)!r})"
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class DialogueState:
-    """A class to represent the state of a dialogue."""
+    """A class to represent the state of a dialogue.
 
-    history: List[AnnotatedUtterance] = field(default_factory=list)
+    States are snapshots; the tracker creates a new state on every update.
+    The history and slots are read-only views that share the tracker's data
+    without copying it, but are not affected by later updates. The history
+    holds only the most recent utterances if the tracker has a history window.
+    """
+
+    history: Sequence[AnnotatedUtterance] = field(
+        default_factory=lambda: HistoryView([])
+    )
     last_user_intent: Optional[Intent] = None
-    slots: Dict[str, List[Annotation]] = field(
-        default_factory=lambda: defaultdict(list)
+    slots: Mapping[str, Tuple[Annotation, ...]] = field(
+        default_factory=lambda: SlotsView({})
     )
     turn_count: int = 0
+    # Incremented on every update, so that changes can be detected without
+    # comparing the history or slots.
+    version: int = 0
+
+    def get_slot_values(self, slot: str) -> List[str]:
+        """Returns the values annotated for a slot, in order of annotation.
+
+        Args:
+            slot: Slot name.
+
+        Returns:
+            List of slot values; empty if the slot has not been annotated.
+        """
+        return [annotation.value for annotation in self.slots.get(slot, ())]
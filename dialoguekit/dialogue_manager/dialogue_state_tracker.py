@@ -1,21 +1,37 @@
 """A module for tracking the state of a dialogue."""
 
-from collections import defaultdict
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from collections import deque
+from dataclasses import replace
+from itertools import groupby
+from operator import attrgetter
+from typing import Dict, List, Mapping, MutableSequence, Optional, Tuple
 
 from dialoguekit.core.annotated_utterance import AnnotatedUtterance
 from dialoguekit.core.annotation import Annotation
-from dialoguekit.core.intent import Intent
-from dialoguekit.dialogue_manager.dialogue_state import DialogueState
+from dialoguekit.dialogue_manager.dialogue_state import (
+    DialogueState,
+    HistoryView,
+    SlotsView,
+)
 from dialoguekit.participant.participant import DialogueParticipant
 
+_USER = DialogueParticipant.USER
+
 
 class DialogueStateTracker:
 
-    def __init__(self, **kwargs) -> None:
-        """Initializes the dialogue state tracker."""
+    def __init__(self, history_window: Optional[int] = None, **kwargs) -> None:
+        """Initializes the dialogue state tracker.
+
+        Args:
+            history_window: Maximum number of utterances kept in the history.
+              Older utterances are dropped once the window is full. Defaults
+              to None (the full history is kept).
+        """
         super().__init__(**kwargs)
+        self._history: MutableSequence[AnnotatedUtterance] = (
+            [] if history_window is None else deque(maxlen=history_window)
+        )
         self._dialogue_state = DialogueState()
 
     def get_state(self) -> DialogueState:
@@ -32,13 +48,58 @@ class DialogueStateTracker:
         Args:
             annotated_utterance: The annotated utterance.
         """
-        self._dialogue_state.history.append(annotated_utterance)
-        if annotated_utterance.participant is not DialogueParticipant.USER:
+        dialogue_state = self._dialogue_state
+        self._history.append(annotated_utterance)
+        # The history list is append-only, so a view of its current length
+        # is a snapshot. A windowed history drops utterances and is copied.
+        history = (
+            HistoryView(self._history, stop=len(self._history))
+            if isinstance(self._history, list)
+            else HistoryView(list(self._history))
+        )
+        if annotated_utterance.participant is not _USER:
+            self._dialogue_state = replace(
+                dialogue_state,
+                history=history,
+                version=dialogue_state.version + 1,
+            )
             return
 
-        self._dialogue_state.last_user_intent = annotated_utterance.intent
+        self._dialogue_state = replace(
+            dialogue_state,
+            history=history,
+            slots=self._update_slots(
+                dialogue_state.slots, annotated_utterance.annotations
+            ),
+            last_user_intent=annotated_utterance.intent,
+            turn_count=dialogue_state.turn_count + 1,
+            version=dialogue_state.version + 1,
+        )
+
+    @staticmethod
+    def _update_slots(
+        slots: Mapping[str, Tuple[Annotation, ...]],
+        annotations: List[Annotation],
+    ) -> Mapping[str, Tuple[Annotation, ...]]:
+        """Returns the slots with the annotations added.
 
-        for annotation in annotated_utterance.annotations:
-            self._dialogue_state.slots[annotation.slot].append(annotation)
+        The slots are copied, rather than updated in place, so that earlier
+        states keep their slots.
 
-        self._dialogue_state.turn_count += 1
+        Args:
+            slots: Annotations per slot.
+            annotations: Annotations to add.
+
+        Returns:
+            Annotations per slot.
+        """
+        if not annotations:
+            return slots
+        updated_slots: Dict[str, Tuple[Annotation, ...]] = dict(slots)
+        for slot, slot_annotations in groupby(
+            annotations, key=attrgetter("slot")
+        ):
+            updated_slots[slot] = updated_slots.get(slot, ()) + tuple(
+                slot_annotations
+            )
+        return SlotsView(updated_slots)
@@ -1,10 +1,27 @@
 """Extract user response utterance templates from annotated training data."""
 
-import copy
 import json
+import mmap
 import os
+import re
 from collections import defaultdict
-from typing import DefaultDict, Dict, List, Optional, Set, Union
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice
+from typing import (
+    Any,
+    DefaultDict,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Match,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    Union,
+)
 
 from dialoguekit.core.annotated_utterance import AnnotatedUtterance
 from dialoguekit.core.annotation import Annotation
@@ -21,20 +38,116 @@ from dialoguekit.utils.dialogue_reader import (
     _FIELD_UTTERANCE,
 )
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None  # type: ignore[assignment]
+
 # The default satisfaction level used for classifying the NLG template.
 _DEFAULT_SATISFACTION = 3
+# Number of dialogues processed by a worker at a time. Fewer dialogues than
+# this are processed in the calling process.
+_DIALOGUE_CHUNK_SIZE = 500
+
+# Arguments shared by all chunks of dialogues processed in a worker process,
+# set once per worker by `_init_worker`.
+_worker_participant_to_learn = "USER"
+_worker_satisfaction_classifier: Optional[SatisfactionClassifier] = None
+
+
+def _load_json_file(path: str) -> Any:
+    """Parses a JSON file, using orjson when it is installed.
+
+    With orjson, the file is memory-mapped and parsed in place instead of
+    being read into memory first.
+
+    Args:
+        path: Path to the JSON file.
+
+    Returns:
+        The deserialized document.
+    """
+    with open(path, "rb") as input_file:
+        # Empty files cannot be memory-mapped.
+        if orjson is None or os.fstat(input_file.fileno()).st_size == 0:
+            return json.loads(input_file.read())
+        with mmap.mmap(
+            input_file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped_file, memoryview(mapped_file) as data:
+            return orjson.loads(data)
+
+
+def _iter_json_file_items(path: str) -> Iterator[Any]:
+    """Iterates over the items of a JSON array file.
+
+    The file is parsed incrementally with ijson, so only one item is held in
+    memory at a time.
+
+    Args:
+        path: Path to the JSON file.
+
+    Yields:
+        The deserialized items of the top-level array.
+    """
+    with open(path, "rb") as input_file:
+        yield from ijson.items(input_file, "item")
+
+
+@lru_cache(maxsize=1024)
+def _get_slot_value_pattern(values: Tuple[str, ...]) -> Pattern[str]:
+    """Compiles a pattern matching any of the given slot values.
+
+    Longer values are tried first, so that a value that is a prefix of another
+    value does not break up the longer match.
+
+    Args:
+        values: Slot values.
+
+    Returns:
+        Compiled alternation of the escaped slot values.
+    """
+    return re.compile(
+        "|".join(
+            re.escape(value) for value in sorted(values, key=len, reverse=True)
+        )
+    )
 
 
 def _replace_slot_with_placeholder(
     annotated_utterance: AnnotatedUtterance,
 ) -> None:
-    annotations = annotated_utterance.annotations
-    for annotation in annotations:
-        placeholder_label, value = annotation.slot, annotation.value
-        annotated_utterance.text = annotated_utterance.text.replace(
-            value, f"{{{placeholder_label}}}", 1
-        )
+    # Placeholder labels for each slot value, in order of annotation.
+    placeholder_labels: DefaultDict[str, List[str]] = defaultdict(list)
+    for annotation in annotated_utterance.annotations:
+        if annotation.value:
+            placeholder_labels[annotation.value].append(annotation.slot)
         annotation.value = None
+    if not placeholder_labels:
+        return
+    if len(placeholder_labels) == 1:
+        ((value, labels),) = placeholder_labels.items()
+        if len(labels) == 1:
+            # A single slot value is cheaper to replace without a pattern.
+            annotated_utterance.text = annotated_utterance.text.replace(
+                value, f"{{{labels[0]}}}", 1
+            )
+            return
+
+    def _to_placeholder(match: Match[str]) -> str:
+        labels = placeholder_labels[match.group(0)]
+        if not labels:
+            return match.group(0)
+        return f"{{{labels.pop(0)}}}"
+
+    pattern = _get_slot_value_pattern(tuple(sorted(placeholder_labels)))
+    annotated_utterance.text = pattern.sub(
+        _to_placeholder, annotated_utterance.text
+    )
 
 
 def build_template_from_instances(
@@ -51,11 +164,11 @@ def build_template_from_instances(
     Returns:
         Dict with Intents and lists with corresponding AnnotatedUtterances.
     """
-    template = defaultdict(list)
+    template: DefaultDict[Intent, Set[AnnotatedUtterance]] = defaultdict(set)
     for utterance in utterances:
         if isinstance(utterance.intent, Intent):
             _replace_slot_with_placeholder(utterance)
-            template[utterance.intent].append(utterance)
+            template[utterance.intent].add(utterance)
         else:
             print(
                 f'Utterance was skipped.\nUtterance "{utterance.text}", \
@@ -63,17 +176,235 @@ def build_template_from_instances(
             )
 
     return_template = {
-        intent: list(set(utterance)) for intent, utterance in template.items()
+        intent: list(utterance) for intent, utterance in template.items()
     }
     return return_template
 
 
-def extract_utterance_template(  # noqa: C901
+def _extract_dialogue_templates(
+    dialog: Dict[str, Any],
+    response_templates: DefaultDict[Intent, Set[AnnotatedUtterance]],
+    participant_to_learn: str,
+    satisfaction_classifier: Optional[SatisfactionClassifier],
+) -> None:
+    """Adds the utterance templates of a single dialogue.
+
+    Args:
+        dialog: Dialogue as loaded from the annotated dialogue json file.
+        response_templates: Templates per intent, updated in place.
+        participant_to_learn: Which participant we want to create a template on.
+        satisfaction_classifier: SatisfactionClassifier
+    """
+    counter_participant_text = None
+    participant_text = None
+    satisfaction = None
+    for utterance_record in dialog.get(_FIELD_CONVERSATION):
+        participant = utterance_record.get(_FIELD_PARTICIPANT)
+        text = utterance_record.get(_FIELD_UTTERANCE).strip()
+
+        # Utterances from the counter-participant are only used for
+        # classifying satisfaction.
+        if participant != participant_to_learn:
+            if participant_text is not None and satisfaction_classifier:
+                satisfaction = satisfaction_classifier.classify_text(
+                    dialogue_text=f"{participant_text} {text}"
+                )
+                counter_participant_text = text
+            continue
+
+        intent = Intent(utterance_record.get(_FIELD_INTENT))
+        slot_values = utterance_record.get(_FIELD_SLOT_VALUES)
+        annotated_utterance = AnnotatedUtterance(
+            text=text,
+            intent=intent,
+            participant=DialogueParticipant.AGENT,
+        )
+        if satisfaction_classifier:
+            # Satisfaction defaults to 3 (Normal)
+            annotated_utterance.metadata["satisfaction"] = _DEFAULT_SATISFACTION
+            if counter_participant_text is not None:
+                annotated_utterance.metadata["satisfaction"] = satisfaction
+                counter_participant_text = None
+
+        # Keep the original utterance as template when it does not contain
+        # slot values.
+        if slot_values is not None:
+            annotated_utterance.add_annotations(
+                [
+                    Annotation(slot=slot, value=value)
+                    for slot, value in slot_values
+                ]
+            )
+            _replace_slot_with_placeholder(annotated_utterance)
+
+        response_templates[intent].add(annotated_utterance)
+        participant_text = text
+
+
+def _init_worker(
+    participant_to_learn: str,
+    satisfaction_classifier: Optional[SatisfactionClassifier],
+) -> None:
+    """Sets the extraction arguments of a worker process.
+
+    Args:
+        participant_to_learn: Which participant we want to create a template on.
+        satisfaction_classifier: SatisfactionClassifier
+    """
+    global _worker_participant_to_learn, _worker_satisfaction_classifier
+    _worker_participant_to_learn = participant_to_learn
+    _worker_satisfaction_classifier = satisfaction_classifier
+
+
+def _extract_chunk_templates(
+    dialogs: List[Dict[str, Any]],
+) -> DefaultDict[Intent, Set[AnnotatedUtterance]]:
+    """Extracts the utterance templates of a chunk of dialogues in a worker.
+
+    Args:
+        dialogs: Dialogues as loaded from the annotated dialogue json file.
+
+    Returns:
+        Templates per intent.
+    """
+    response_templates: DefaultDict[
+        Intent, Set[AnnotatedUtterance]
+    ] = defaultdict(set)
+    for dialog in dialogs:
+        _extract_dialogue_templates(
+            dialog,
+            response_templates,
+            _worker_participant_to_learn,
+            _worker_satisfaction_classifier,
+        )
+    return response_templates
+
+
+def _merge_templates(
+    response_templates: DefaultDict[Intent, Set[AnnotatedUtterance]],
+    partial_templates: Iterable[Dict[Intent, Set[AnnotatedUtterance]]],
+) -> None:
+    """Merges templates extracted from chunks of dialogues.
+
+    Args:
+        response_templates: Templates per intent, updated in place.
+        partial_templates: Templates per intent of each chunk.
+    """
+    for chunk_templates in partial_templates:
+        for intent, utterances in chunk_templates.items():
+            response_templates[intent].update(utterances)
+
+
+def _chunked(
+    iterable: Iterable[Dict[str, Any]], size: int
+) -> Iterator[List[Dict[str, Any]]]:
+    """Splits an iterable into lists of at most the given size."""
+    iterator = iter(iterable)
+    chunk = list(islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, size))
+
+
+def extract_utterance_templates(
+    annotated_dialogue_files: List[str],
+    participant_to_learn: str = "USER",
+    satisfaction_classifier: Optional[
+        Union[None, SatisfactionClassifier]
+    ] = None,
+    stream: bool = False,
+    num_workers: int = 1,
+) -> Dict[Intent, List[AnnotatedUtterance]]:
+    """Extracts utterance templates for each intent from multiple files.
+
+    Templates from all files are merged per intent. See
+    `extract_utterance_template` for how the satisfaction classifier is used.
+
+    Args:
+        annotated_dialogue_files: Annotated dialogue json files.
+        participant_to_learn: Which participant we want to create a template on.
+        satisfaction_classifier: SatisfactionClassifier
+        stream: Whether to parse the files incrementally instead of loading
+          them whole. With a single worker, only one dialogue is held in
+          memory at a time. Requires ijson. Defaults to False.
+        num_workers: Number of worker processes to extract templates with.
+          Dialogues are handed to the workers in chunks, and only if a file
+          has more than one chunk of them. The satisfaction classifier, if
+          given, must be picklable. Defaults to 1.
+
+    Raises:
+        FileNotFoundError: If any of the files does not exist.
+        ImportError: If streaming is requested but ijson is not installed.
+
+    Returns:
+        Dict with Intents and lists with corresponding AnnotatedUtterances.
+    """
+    if stream and ijson is None:
+        raise ImportError("Streaming annotated dialogues requires ijson.")
+    for annotated_dialogue_file in annotated_dialogue_files:
+        if not os.path.isfile(annotated_dialogue_file):
+            raise FileNotFoundError(
+                f"Annotated dialog file not found: {annotated_dialogue_file}"
+            )
+    response_templates: DefaultDict[
+        Intent, Set[AnnotatedUtterance]
+    ] = defaultdict(set)
+    executor: Optional[ProcessPoolExecutor] = None
+    try:
+        for annotated_dialogue_file in annotated_dialogue_files:
+            annotated_dialogs = (
+                _iter_json_file_items(annotated_dialogue_file)
+                if stream
+                else _load_json_file(annotated_dialogue_file)
+            )
+            if num_workers > 1:
+                chunks = _chunked(annotated_dialogs, _DIALOGUE_CHUNK_SIZE)
+                first_chunk = next(chunks, [])
+                second_chunk = next(chunks, [])
+                if second_chunk:
+                    if executor is None:
+                        executor = ProcessPoolExecutor(
+                            max_workers=num_workers,
+                            initializer=_init_worker,
+                            initargs=(
+                                participant_to_learn,
+                                satisfaction_classifier,
+                            ),
+                        )
+                    _merge_templates(
+                        response_templates,
+                        executor.map(
+                            _extract_chunk_templates,
+                            chain([first_chunk, second_chunk], chunks),
+                        ),
+                    )
+                    continue
+                annotated_dialogs = first_chunk
+            for dialog in annotated_dialogs:
+                _extract_dialogue_templates(
+                    dialog,
+                    response_templates,
+                    participant_to_learn,
+                    satisfaction_classifier,
+                )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return_template = {
+        key: list(val) for key, val in response_templates.items()
+    }
+    return return_template
+
+
+def extract_utterance_template(
     annotated_dialogue_file: str,
     participant_to_learn: str = "USER",
     satisfaction_classifier: Optional[
         Union[None, SatisfactionClassifier]
     ] = None,
+    stream: bool = False,
+    num_workers: int = 1,
 ) -> Dict[Intent, List[AnnotatedUtterance]]:
     """Extracts utterance templates for each intent.
 
@@ -92,87 +423,19 @@ def extract_utterance_template(  # noqa: C901
         Annotated_dialog_file: annotated dialogue json file.
         participant_to_learn: Which participant we want to create a template on.
         satisfaction_classifier: SatisfactionClassifier
+        stream: Whether to parse the file incrementally instead of loading it
+          whole. With a single worker, only one dialogue is held in memory at
+          a time. Requires ijson. Defaults to False.
+        num_workers: Number of worker processes to extract templates with.
+          Defaults to 1.
 
     Returns:
         Dict with Intents and lists with corresponding AnnotatedUtterances.
     """
-    if not os.path.isfile(annotated_dialogue_file):
-        raise FileNotFoundError(
-            f"Annotated dialog file not found: {annotated_dialogue_file}"
-        )
-    response_templates: DefaultDict[
-        Intent, Set[AnnotatedUtterance]
-    ] = defaultdict(set)
-    with open(annotated_dialogue_file, encoding="utf-8") as input_file:
-        annotated_dialogs = json.load(input_file)
-        for dialog in annotated_dialogs:
-            counter_participant_utterance = None
-            participant_utterance = None
-            satisfaction = None
-            for utterance_record in dialog.get(_FIELD_CONVERSATION):
-                participant = utterance_record.get(_FIELD_PARTICIPANT)
-
-                if satisfaction_classifier:
-                    annotated_utterance = AnnotatedUtterance(
-                        text=utterance_record.get(_FIELD_UTTERANCE).strip(),
-                        intent=Intent(utterance_record.get(_FIELD_INTENT)),
-                        metadata={
-                            "satisfaction": _DEFAULT_SATISFACTION
-                        },  # Satisfaction defaults to 3 (Normal)
-                        participant=DialogueParticipant.AGENT,
-                    )
-                else:
-                    annotated_utterance = AnnotatedUtterance(
-                        text=utterance_record.get(_FIELD_UTTERANCE).strip(),
-                        intent=Intent(utterance_record.get(_FIELD_INTENT)),
-                        participant=DialogueParticipant.AGENT,
-                    )
-                annotated_utterance_copy = copy.deepcopy(annotated_utterance)
-
-                # Only use the utterances from the wanted participant
-                if participant == participant_to_learn:
-                    if (
-                        counter_participant_utterance
-                        and participant_utterance
-                        and satisfaction_classifier
-                    ):
-                        annotated_utterance.metadata[
-                            "satisfaction"
-                        ] = satisfaction
-                        counter_participant_utterance = None
-                        participant_utterance = None
-
-                    # Keep the original utterance as template when it does not
-                    # contain slot values.
-                    if "slot_values" in utterance_record:
-                        for slot, value in utterance_record.get(
-                            _FIELD_SLOT_VALUES
-                        ):
-                            annotated_utterance.add_annotations(
-                                [Annotation(slot=slot, value=value)]
-                            )
-                        if satisfaction_classifier:
-                            annotated_utterance_copy = copy.deepcopy(
-                                annotated_utterance
-                            )
-
-                        _replace_slot_with_placeholder(annotated_utterance)
-
-                    response_templates[annotated_utterance.intent].add(
-                        annotated_utterance
-                    )
-                    participant_utterance = annotated_utterance_copy
-                else:
-                    if participant_utterance and satisfaction_classifier:
-                        satisfaction = satisfaction_classifier.classify_text(
-                            dialogue_text=(
-                                f"{participant_utterance.text} "
-                                f"{annotated_utterance_copy.text}"
-                            )
-                        )
-                        counter_participant_utterance = annotated_utterance_copy
-
-    return_template = {
-        key: list(val) for key, val in response_templates.items()
-    }
-    return return_template
+    return extract_utterance_templates(
+        [annotated_dialogue_file],
+        participant_to_learn=participant_to_learn,
+        satisfaction_classifier=satisfaction_classifier,
+        stream=stream,
+        num_workers=num_workers,
+    )
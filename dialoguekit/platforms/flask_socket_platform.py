@@ -2,35 +2,237 @@
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
-from dataclasses import asdict, dataclass
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, cast
+import os
+import queue
+import threading
+from dataclasses import asdict, dataclass, fields, is_dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
 from flask import Flask, Request, request
 from flask_socketio import Namespace, SocketIO, emit
 
 from dialoguekit.core import AnnotatedUtterance
+from dialoguekit.core.dataclass_slots import DATACLASS_SLOTS
 from dialoguekit.platforms.platform import Platform
 
 if TYPE_CHECKING:
     from dialoguekit.core import Utterance
     from dialoguekit.participant.agent import Agent
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 
 logger = logging.getLogger(__name__)
 
 _STUDY_PATH = "export/study.json"
 
+_study_cache: Optional[Dict[str, Any]] = None
+_study_lock = threading.Lock()
+# Serialized study data waiting to be written by the writer thread.
+_study_queue: queue.Queue[bytes] = queue.Queue()
+_study_writer: Optional[threading.Thread] = None
+# Last error of the writer thread, raised by `flush_study_data`.
+_study_error: Optional[Exception] = None
+
 
-def load_study_data():
+def _read_study_file() -> Dict[str, Any]:
+    """Reads the study data from disk."""
+    if orjson is not None:
+        with open(_STUDY_PATH, "rb") as f:
+            return orjson.loads(f.read())
     with open(_STUDY_PATH) as f:
         return json.load(f)
 
 
-def save_study_data(data: Dict[str, Any]):
-    with open(_STUDY_PATH, "w") as f:
-        json.dump(data, f)
+def _write_study_file(payload: bytes) -> None:
+    """Writes serialized study data to disk.
+
+    The data is written to a temporary file that then replaces the study
+    file, so that a crash mid-write does not leave a truncated file behind.
+    """
+    tmp_path = f"{_STUDY_PATH}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, _STUDY_PATH)
+
+
+def _study_writer_loop() -> None:
+    """Writes queued study data to disk.
+
+    Only the most recent of the queued payloads is written, as it supersedes
+    the others. Write errors are kept, to be raised by `flush_study_data`.
+    """
+    global _study_error
+    while True:
+        payloads = [_study_queue.get()]
+        while not _study_queue.empty():
+            payloads.append(_study_queue.get_nowait())
+        try:
+            _write_study_file(payloads[-1])
+        except Exception as e:
+            logger.exception("Failed to write study data.")
+            _study_error = e
+        finally:
+            for _ in payloads:
+                _study_queue.task_done()
+
+
+def load_study_data() -> Dict[str, Any]:
+    """Returns the study data.
+
+    The study file is only read on the first call, later calls return the
+    cached data.
+
+    Returns:
+        Study data.
+    """
+    global _study_cache
+    with _study_lock:
+        if _study_cache is None:
+            _study_cache = _read_study_file()
+        return _study_cache
+
+
+def save_study_data(data: Dict[str, Any]) -> None:
+    """Saves the study data.
+
+    The data is cached and serialized, and then written to disk by a
+    background thread, so the caller does not wait for the write. Use
+    `flush_study_data` to wait for pending writes.
+
+    Args:
+        data: Study data.
+    """
+    global _study_cache, _study_writer
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data).encode()
+    with _study_lock:
+        _study_cache = data
+        if _study_writer is None:
+            _study_writer = threading.Thread(
+                target=_study_writer_loop, name="study-writer", daemon=True
+            )
+            _study_writer.start()
+        _study_queue.put(payload)
+
+
+def flush_study_data() -> None:
+    """Waits until pending study data is written to disk.
+
+    Raises:
+        Exception: The last error that occurred while writing study data
+          since the previous flush.
+    """
+    global _study_error
+    _study_queue.join()
+    if _study_error is not None:
+        error, _study_error = _study_error, None
+        raise error
+
+
+atexit.register(flush_study_data)
+
+
+# Field names of article dataclass types, and whether any of the fields may
+# hold a nested dataclass.
+_article_fields: Dict[type, Tuple[Tuple[str, ...], bool]] = {}
+
+
+def _may_hold_dataclass(field_type: Any) -> bool:
+    """Checks whether a value of a type may be or contain a dataclass.
+
+    Types that cannot be resolved, such as Any, are assumed to hold one.
+
+    Args:
+        field_type: Type annotation of a field.
+
+    Returns:
+        True if a value of the type may be or contain a dataclass instance,
+        otherwise False.
+    """
+    if isinstance(field_type, type) and issubclass(
+        field_type, (str, int, float, bytes, type(None))
+    ):
+        return False
+    if is_dataclass(field_type):
+        return True
+    type_args = get_args(field_type)
+    if type_args:
+        return any(
+            _may_hold_dataclass(type_arg)
+            for type_arg in type_args
+            if type_arg is not Ellipsis
+        )
+    if isinstance(field_type, type) and get_origin(field_type) is None:
+        # Unparameterized containers may hold anything.
+        return issubclass(field_type, (list, tuple, dict, set, frozenset))
+    return True
+
+
+def _get_article_fields(dataclass_type: type) -> Tuple[Tuple[str, ...], bool]:
+    """Returns the field names of an article dataclass type.
+
+    Args:
+        dataclass_type: Dataclass type.
+
+    Returns:
+        Tuple of field names, and whether any of the fields may hold a
+        nested dataclass.
+    """
+    article_fields = _article_fields.get(dataclass_type)
+    if article_fields is None:
+        try:
+            type_hints = get_type_hints(dataclass_type)
+        except (NameError, TypeError):
+            type_hints = {}
+        dataclass_fields = fields(dataclass_type)
+        article_fields = (
+            tuple(f.name for f in dataclass_fields),
+            any(
+                _may_hold_dataclass(type_hints.get(f.name, Any))
+                for f in dataclass_fields
+            ),
+        )
+        _article_fields[dataclass_type] = article_fields
+    return article_fields
+
+
+def _article_to_dict(article: Any) -> Dict[str, Any]:
+    """Converts an article dataclass to a dictionary.
+
+    Unlike `asdict`, fields are not recursively deep copied. `asdict` is only
+    used when the type of a field allows a nested dataclass.
+
+    Args:
+        article: Article dataclass instance.
+
+    Returns:
+        Dictionary with the fields of the article.
+    """
+    field_names, nested = _get_article_fields(type(article))
+    if nested:
+        return asdict(article)
+    return {name: getattr(article, name) for name in field_names}
 
 
 class SocketIORequest(Request):
@@ -39,7 +241,12 @@ class SocketIORequest(Request):
     sid: str
 
 
-@dataclass
+def _get_sid() -> str:
+    """Returns the session ID of the client that sent the current request."""
+    return cast(SocketIORequest, request).sid
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Message:
     text: str
     intent: Optional[str] = None
@@ -55,12 +262,15 @@ class Message:
             An instance of Message.
         """
         message = Message(utterance.text)
-        if isinstance(utterance, AnnotatedUtterance):
-            message.intent = str(utterance.intent)
+        if (
+            isinstance(utterance, AnnotatedUtterance)
+            and utterance.intent is not None
+        ):
+            message.intent = utterance.intent.label
         return message
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Response:
     recipient: str
     message: Message
@@ -124,7 +334,7 @@ class FlaskSocketPlatform(Platform):
             user_id: User ID.
             articles: List of scored articles.
         """
-        articles = [asdict(article) for article in articles]
+        articles = [_article_to_dict(article) for article in articles]
         self.socketio.emit("recommendations", articles, room=user_id)
 
     def provide_bookmarks(self, user_id: str, articles: List) -> None:
@@ -134,7 +344,7 @@ class FlaskSocketPlatform(Platform):
             user_id: User ID.
             articles: List of scored articles.
         """
-        articles = [asdict(article) for article in articles]
+        articles = [_article_to_dict(article) for article in articles]
         self.socketio.emit("bookmarks", articles, room=user_id)
 
     def initialize(
@@ -177,18 +387,18 @@ class ChatNamespace(Namespace):
 
     def on_connect(self) -> None:
         """Connects client to platform."""
-        req: SocketIORequest = cast(SocketIORequest, request)
-        self._platform.connect(req.sid)
+        sid = _get_sid()
+        self._platform.connect(sid)
         mode = request.args.get("mode")
         token = request.args.get("token")
-        self._platform.initialize(req.sid, mode, token)
-        logger.info(f"Client connected; user_id: {req.sid}")
+        self._platform.initialize(sid, mode, token)
+        logger.info(f"Client connected; user_id: {sid}")
 
     def on_disconnect(self) -> None:
         """Disconnects client from server."""
-        req: SocketIORequest = cast(SocketIORequest, request)
-        self._platform.disconnect(req.sid)
-        logger.info(f"Client disconnected; user_id: {req.sid}")
+        sid = _get_sid()
+        self._platform.disconnect(sid)
+        logger.info(f"Client disconnected; user_id: {sid}")
 
     def on_start_conversation(self, data: dict) -> None:
         """Starts conversation.
@@ -196,9 +406,9 @@ class ChatNamespace(Namespace):
         Args:
             data: Data received from client.
         """
-        req: SocketIORequest = cast(SocketIORequest, request)
-        # self._active_connections[req.sid].start()
-        dc = self._platform.get_dialogue_connector(req.sid)
+        sid = _get_sid()
+        # self._active_connections[sid].start()
+        dc = self._platform.get_dialogue_connector(sid)
         if dc:
             dc.start()
         logger.info(f"Conversation started: {data}")
@@ -209,8 +419,8 @@ class ChatNamespace(Namespace):
         Args:
             data: Data received from client.
         """
-        req: SocketIORequest = cast(SocketIORequest, request)
-        self._platform.message(req.sid, data["message"])
+        sid = _get_sid()
+        self._platform.message(sid, data["message"])
         logger.info(f"Message received: {data}")
 
     def on_feedback(self, data: dict) -> None:
@@ -219,9 +429,9 @@ class ChatNamespace(Namespace):
         Args:
             data: Data received from client.
         """
-        req: SocketIORequest = cast(SocketIORequest, request)
+        sid = _get_sid()
         logger.info(f"Utterance feedback received: {data}")
-        self._platform.feedback(req.sid, data["utterance_id"], data["feedback"])
+        self._platform.feedback(sid, data["utterance_id"], data["feedback"])
 
     def on_recommendation_feedback(self, data: dict) -> None:
         """Receives feedback from client.
@@ -229,9 +439,9 @@ class ChatNamespace(Namespace):
         Args:
             data: Data received from client.
         """
-        req: SocketIORequest = cast(SocketIORequest, request)
+        sid = _get_sid()
         logger.info(f"Item feedback received: {data}")
-        agent = self.get_agent(req.sid)
+        agent = self._platform.get_agent(sid)
         agent.handle_recommendation_feedback(data["item_id"], data["feedback"])
 
     def on_get_bookmarks(self, data: dict) -> None:
@@ -240,8 +450,8 @@ class ChatNamespace(Namespace):
         Args:
             data: Data received from client.
         """
-        req: SocketIORequest = cast(SocketIORequest, request)
-        agent = self._platform.get_agent(req.sid)
+        sid = _get_sid()
+        agent = self._platform.get_agent(sid)
         logger.info(f"Sending bookmarks: {data}")
         emit("bookmarks", agent.get_bookmarks())
 
@@ -251,9 +461,9 @@ class ChatNamespace(Namespace):
         Args:
             data: Data received from client.
         """
-        req: SocketIORequest = cast(SocketIORequest, request)
+        sid = _get_sid()
         logger.info(f"Bookmark request received: {data}")
-        agent = self._platform.get_agent(req.sid)
+        agent = self._platform.get_agent(sid)
         agent.handle_bookmark_article(data["item_id"])
 
     def on_remove_bookmark(self, data: dict) -> None:
@@ -262,9 +472,9 @@ class ChatNamespace(Namespace):
         Args:
             data: Data received from client.
         """
-        req: SocketIORequest = cast(SocketIORequest, request)
+        sid = _get_sid()
         logger.info(f"Remove bookmark request received: {data}")
-        agent = self._platform.get_agent(req.sid)
+        agent = self._platform.get_agent(sid)
         agent.handle_remove_bookmark(data["item_id"])
 
     def on_get_preferences(self, data: dict) -> None:
@@ -273,8 +483,8 @@ class ChatNamespace(Namespace):
         Args:
             data: Data received from client.
         """
-        req: SocketIORequest = cast(SocketIORequest, request)
-        agent = self._platform.get_agent(req.sid)
+        sid = _get_sid()
+        agent = self._platform.get_agent(sid)
         logger.info(f"Sending preferences: {data}")
         emit("preferences", agent.get_preferences())
 
@@ -284,8 +494,8 @@ class ChatNamespace(Namespace):
         Args:
             data: Data received from client.
         """
-        req: SocketIORequest = cast(SocketIORequest, request)
-        agent = self._platform.get_agent(req.sid)
+        sid = _get_sid()
+        agent = self._platform.get_agent(sid)
         logger.info(f"Removing preference: {data}")
         agent.handle_remove_preference(data["topic"])
 
@@ -295,7 +505,7 @@ class ChatNamespace(Namespace):
         Args:
             data: Data received from client.
         """
-        req: SocketIORequest = cast(SocketIORequest, request)
-        agent = self._platform.get_agent(req.sid)
+        sid = _get_sid()
+        agent = self._platform.get_agent(sid)
         logger.info(f"Setting style: {data}")
         agent.set_style(data["style"])
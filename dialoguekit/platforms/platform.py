@@ -1,35 +1,63 @@
 """The Platform facilitates displaying of the conversation."""
 
-from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Type
+from threading import Lock
+from typing import Any, Dict, Iterable, Optional, Set, Tuple, Type
 
 from dialoguekit.connector import DialogueConnector
 from dialoguekit.core import Utterance
 from dialoguekit.participant import Agent, User
 
+# Agent classes that have passed the subclass check in Platform.__init__.
+_verified_agent_classes: Set[type] = set()
+# Methods that subclasses of Platform must override.
+_ABSTRACT_METHODS = (
+    "start",
+    "display_agent_utterance",
+    "display_user_utterance",
+)
+
+
+class Platform:
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Checks that a subclass overrides the abstract methods.
+
+        Raises:
+            TypeError: If an abstract method is not overridden.
+        """
+        super().__init_subclass__(**kwargs)
+        for name in _ABSTRACT_METHODS:
+            if getattr(cls, name) is getattr(Platform, name):
+                raise TypeError(f"{cls.__name__} must override {name}")
 
-class Platform(ABC):
     def __init__(self, agent_class: Type[Agent]) -> None:
         """Represents a platform.
 
         Args:
             agent_class: The class of the agent.
+
+        Raises:
+            TypeError: If Platform is instantiated directly.
+            ValueError: If agent_class is not a subclass of Agent.
         """
-        if not issubclass(agent_class, Agent):
-            raise ValueError("agent_class must be a subclass of Agent")
+        if type(self) is Platform:
+            raise TypeError("Platform must be subclassed")
+        if agent_class not in _verified_agent_classes:
+            if not issubclass(agent_class, Agent):
+                raise ValueError("agent_class must be a subclass of Agent")
+            _verified_agent_classes.add(agent_class)
         self._agent_class = agent_class
+        self._agent_name = agent_class.__name__
+        # Active connections are copied on write and never mutated in place,
+        # so readers need no lock. Connecting and disconnecting copy the
+        # dict, which is linear in the number of users but rare compared to
+        # lookups.
         self._active_connections: Dict[str, DialogueConnector] = {}
+        self._connections_lock = Lock()
 
-    @abstractmethod
     def start(self) -> None:
-        """Starts the platform.
+        """Starts the platform."""
+        ...
 
-        Raises:
-            NotImplementedError: If the method is not implemented.
-        """
-        raise NotImplementedError
-
-    @abstractmethod
     def display_agent_utterance(
         self, user_id: str, utterance: Utterance
     ) -> None:
@@ -38,13 +66,9 @@ class Platform(ABC):
         Args:
             user_id: User ID.
             utterance: An instance of Utterance.
-
-        Raises:
-            NotImplementedError: If the method is not implemented.
         """
-        raise NotImplementedError
+        ...
 
-    @abstractmethod
     def display_user_utterance(
         self, user_id: str, utterance: Utterance
     ) -> None:
@@ -53,11 +77,8 @@ class Platform(ABC):
         Args:
             user_id: User ID.
             utterance: An instance of Utterance.
-
-        Raises:
-            NotImplementedError: If the method is not implemented.
         """
-        raise NotImplementedError
+        ...
 
     def get_dialogue_connector(
         self, user_id: str
@@ -72,6 +93,45 @@ class Platform(ABC):
         """
         return self._active_connections.get(user_id)
 
+    def get_user(self, user_id: str) -> User:
+        """Returns a connected user.
+
+        Args:
+            user_id: User ID.
+
+        Raises:
+            KeyError: If the user is not connected.
+
+        Returns:
+            User.
+        """
+        return self._active_connections[user_id].user
+
+    def get_agent(self, user_id: str) -> Agent:
+        """Returns the agent a user is connected to.
+
+        Args:
+            user_id: User ID.
+
+        Raises:
+            KeyError: If the user is not connected.
+
+        Returns:
+            Agent.
+        """
+        return self._active_connections[user_id].agent
+
+    def get_new_agent(self, user_id: str) -> Agent:
+        """Returns a new agent for a user.
+
+        Args:
+            user_id: User ID.
+
+        Returns:
+            Agent.
+        """
+        return self._agent_class(self._agent_name)
+
     def connect(self, user_id: str) -> None:
         """Connects a user to an agent.
 
@@ -79,11 +139,16 @@ class Platform(ABC):
             user_id: User ID.
         """
         user = User(user_id)
-        self._active_connections[user_id] = DialogueConnector(
+        dialogue_connector = DialogueConnector(
             agent=self.get_new_agent(user_id),
             user=user,
             platform=self,
         )
+        with self._connections_lock:
+            self._active_connections = {
+                **self._active_connections,
+                user_id: dialogue_connector,
+            }
 
     def disconnect(self, user_id: str) -> None:
         """Disconnects a user from an agent.
@@ -91,19 +156,32 @@ class Platform(ABC):
         Args:
             user_id: User ID.
         """
-        dialogue_connector = self._active_connections.pop(user_id)
+        with self._connections_lock:
+            active_connections = dict(self._active_connections)
+            dialogue_connector = active_connections.pop(user_id)
+            self._active_connections = active_connections
         dialogue_connector.close()
 
     def message(
-        self, user_id: str, message: str, metadata: Dict[str, Any]
+        self,
+        user_id: str,
+        message: str,
+        metadata: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Gets called every time there is a new user input.
 
         Args:
             user_id: User ID.
-            text: User input.
+            message: User input.
+            metadata: Metadata of the user input. Defaults to None.
+
+        Raises:
+            KeyError: If the user is not connected.
         """
-        self.get_user(user_id).handle_input(message, metadata)
+        dialogue_connector = self._active_connections.get(user_id)
+        if dialogue_connector is None:
+            raise KeyError(user_id)
+        dialogue_connector.user.handle_input(message, metadata)
 
     def feedback(self, user_id: str, utterance_id: str, value: int) -> None:
         """Gets called every time there is a new feedback.
@@ -112,7 +190,27 @@ class Platform(ABC):
             user_id: User ID.
             utterance_id: Utterance ID.
             value: Feedback value.
+
+        Raises:
+            KeyError: If the user is not connected.
         """
-        self.get_dialogue_connector(user_id).handle_feedback(
-            utterance_id, value
-        )
+        self.feedback_batch(user_id, [(utterance_id, value)])
+
+    def feedback_batch(
+        self, user_id: str, feedbacks: Iterable[Tuple[str, int]]
+    ) -> None:
+        """Handles feedback on multiple utterances at once.
+
+        Args:
+            user_id: User ID.
+            feedbacks: Pairs of utterance ID and feedback value.
+
+        Raises:
+            KeyError: If the user is not connected.
+        """
+        dialogue_connector = self._active_connections.get(user_id)
+        if dialogue_connector is None:
+            raise KeyError(user_id)
+        handle_feedback = dialogue_connector.handle_feedback
+        for utterance_id, value in feedbacks:
+            handle_feedback(utterance_id, value)
@@ -27,7 +27,7 @@ class TerminalPlatform(Platform):
     def start(self) -> None:
         """Starts the platform."""
         self.connect(self._user_id)
-        user: User = self._active_users[self._user_id]
+        user: User = self.get_user(self._user_id)
         while True:
             if not user.ready_for_input:
                 break
@@ -3,7 +3,7 @@
 import warnings
 from collections import defaultdict
 from copy import deepcopy
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
 from dialoguekit.core.annotated_utterance import AnnotatedUtterance
 from dialoguekit.core.dialogue import Dialogue
@@ -45,6 +45,9 @@ class Evaluator:
         self._dialogues = dialogues
         self._dialogue_lengths: List[Union[int, float]] = []
         self._reward_config = reward_config
+        # Metrics that only depend on the dialogues are computed once.
+        self._avg_turns: Optional[float] = None
+        self._user_act_ratio: Optional[Dict[str, float]] = None
         assert isinstance(self._dialogues, list)
         assert all(isinstance(dialogue, Dialogue) for dialogue in dialogues)
         assert _CONFIG_FULL_SET_POINTS in self._reward_config
@@ -61,6 +64,9 @@ class Evaluator:
         Returns:
             The computed metric as a float value.
         """
+        if self._avg_turns is not None:
+            return self._avg_turns
+
         for dialogue in self._dialogues:
             dialogue_turns = 0
             for i in range(len(dialogue.utterances)):
@@ -74,7 +80,10 @@ class Evaluator:
                     dialogue_turns += 1
             self._dialogue_lengths.append(dialogue_turns / 2)
 
-        return sum(self._dialogue_lengths) / len(self._dialogue_lengths)
+        self._avg_turns = sum(self._dialogue_lengths) / len(
+            self._dialogue_lengths
+        )
+        return self._avg_turns
 
     def user_act_ratio(self) -> Dict[str, float]:
         """Computes the UserActRatio for the dialogues.
@@ -85,6 +94,9 @@ class Evaluator:
         Returns:
             A dictionary with participant and ActRatio as key-value pairs.
         """
+        if self._user_act_ratio is not None:
+            return self._user_act_ratio.copy()
+
         statistics: Dict[str, float] = defaultdict(float)
 
         for dialogue in self._dialogues:
@@ -105,7 +117,8 @@ class Evaluator:
                     sender
                 ) / statistics.get(other_sender)
 
-        return statistics_copy
+        self._user_act_ratio = statistics_copy
+        return statistics_copy.copy()
 
     def reward(self) -> Dict[str, List[Dict[str, float]]]:
         """Computes reward for the dialogues, according to the reward config.
@@ -5,7 +5,7 @@ with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
 
-packages = setuptools.find_packages(where="dialoguekit")
+packages = setuptools.find_packages()
 
 setuptools.setup(
     name="dialoguekit",
@@ -28,7 +28,7 @@ setuptools.setup(
         "Operating System :: OS Independent",
     ],
     package_dir={"": "."},
-    packages=setuptools.find_packages(),
+    packages=packages,
     package_data={
         "": [
             "*.joblib",
@@ -39,10 +39,15 @@ setuptools.setup(
     python_requires=">=3.9",
     zip_safe=False,
     install_requires=[
-        "rasa>=3.0",
+        "scikit-learn>=0.24",
+        "PyYAML",
         "Flask>=2.3.2",
         "flask-socketio>=5.3.3",
         "Werkzeug>=2.3.3",
         "websockets<11.0",
     ],
+    extras_require={
+        "nlu": ["rasa>=3.0.8"],
+        "speedups": ["orjson", "ijson"],
+    },
 )
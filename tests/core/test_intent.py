@@ -1,4 +1,6 @@
 """Test Intent class."""
+import pickle
+
 import pytest
 from dialoguekit.core import Intent
 
@@ -23,6 +25,27 @@ def test_hash():
         hash(i1)
     except TypeError:
         pytest.fail("Intent hashing failed")
+    assert hash(i1) == hash(Intent("Test1"))
+    assert hash(i1) != hash(Intent("Test2"))
+
+
+def test_label_interned():
+    """Tests that equal labels are the same object."""
+    label = "".join(["test", "1"])
+    assert Intent(label).label is Intent("test1").label
+
+
+def test_pickle():
+    """Tests that intents survive pickling."""
+    i1 = Intent("test1")
+    i2 = Intent("test2", main_intent=i1)
+    i3 = Intent("test3")
+    i1_copy = pickle.loads(pickle.dumps(i1))
+
+    assert pickle.loads(pickle.dumps(i3)) == i3
+    assert hash(i1_copy) == hash(i1)
+    assert i1_copy.sub_intents[0].label == i2.label
+    assert i1_copy.sub_intents[0].main_intent is i1_copy
 
 
 def test_comparison():
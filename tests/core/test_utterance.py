@@ -22,6 +22,20 @@ def test_hash():
         hash(u1)
     except TypeError:
         pytest.fail("Utterance hashing failed")
+    u2 = Utterance(
+        "Test1", utterance_id="u1", participant=DialogueParticipant.AGENT
+    )
+    assert hash(u1) == hash(u2)
+
+
+def test_hash_after_text_update():
+    """Tests that the hash follows updates of the utterance text."""
+    u1 = Utterance("Test1", participant=DialogueParticipant.AGENT)
+    hash(u1)
+    u1.text = "Test2"
+    assert hash(u1) == hash(
+        Utterance("Test2", participant=DialogueParticipant.AGENT)
+    )
 
 
 def test_comparison():
@@ -1,5 +1,9 @@
 """Tests for the DialogueStateTracker class."""
 
+import copy
+import pickle
+from dataclasses import FrozenInstanceError, asdict
+from typing import Optional
 
 import pytest
 
@@ -68,6 +72,7 @@ def test_update_history(annotated_utterance: AnnotatedUtterance) -> None:
     tracker = DialogueStateTracker()
     tracker.update(annotated_utterance)
     assert tracker.get_state().history == [annotated_utterance]
+    assert tracker.get_state().history[-2:] == [annotated_utterance]
 
 
 def test_update_intent(annotated_utterance: AnnotatedUtterance) -> None:
@@ -91,7 +96,9 @@ def test_update_slots(annotated_utterance: AnnotatedUtterance) -> None:
     """
     tracker = DialogueStateTracker()
     tracker.update(annotated_utterance)
-    assert tracker.get_state().slots == {"name": [Annotation("name", "John")]}
+    assert tracker.get_state().slots == {"name": (Annotation("name", "John"),)}
+    with pytest.raises(TypeError):
+        tracker.get_state().slots["name"] = ()
 
 
 def test_turn_count(annotated_utterance: AnnotatedUtterance) -> None:
@@ -112,3 +119,176 @@ def test_turn_count(annotated_utterance: AnnotatedUtterance) -> None:
     tracker.update(annotated_utterance)
     tracker.update(annotated_utterance_2)
     assert tracker.get_state().turn_count == 2
+
+
+def test_history_window(annotated_utterance: AnnotatedUtterance) -> None:
+    """Test that only the most recent utterances are kept in the history
+    when a history window is set.
+
+    Args:
+        annotated_utterance: Annotated utterance.
+    """
+    tracker = DialogueStateTracker(history_window=2)
+    agent_utterance = AnnotatedUtterance(
+        "Hi, how can I assist you?",
+        DialogueParticipant.AGENT,
+        intent=Intent("offer_help"),
+    )
+
+    tracker.update(annotated_utterance)
+    tracker.update(agent_utterance)
+    tracker.update(annotated_utterance)
+    assert list(tracker.get_state().history) == [
+        agent_utterance,
+        annotated_utterance,
+    ]
+    assert tracker.get_state().history[-1] == annotated_utterance
+    assert tracker.get_state().history[-2:] == [
+        agent_utterance,
+        annotated_utterance,
+    ]
+    assert tracker.get_state().history[:1] == [agent_utterance]
+    assert tracker.get_state().history[::-1] == [
+        annotated_utterance,
+        agent_utterance,
+    ]
+
+
+def test_turn_count_with_history_window(
+    annotated_utterance: AnnotatedUtterance,
+) -> None:
+    """Test that the turn count includes user turns that have been dropped
+    from the history.
+
+    Args:
+        annotated_utterance: Annotated utterance.
+    """
+    tracker = DialogueStateTracker(history_window=1)
+    for _ in range(3):
+        tracker.update(annotated_utterance)
+    assert len(tracker.get_state().history) == 1
+    assert tracker.get_state().turn_count == 3
+
+
+def test_state_is_replaced(annotated_utterance: AnnotatedUtterance) -> None:
+    """Test that states are replaced instead of modified on update.
+
+    Args:
+        annotated_utterance: Annotated utterance.
+    """
+    tracker = DialogueStateTracker()
+    state = tracker.get_state()
+    tracker.update(annotated_utterance)
+
+    assert state.turn_count == 0
+    assert state.last_user_intent is None
+    assert tracker.get_state().turn_count == 1
+    with pytest.raises(FrozenInstanceError):
+        tracker.get_state().turn_count = 2
+    with pytest.raises(AttributeError):
+        tracker.get_state().history.append(annotated_utterance)
+
+
+@pytest.mark.parametrize("history_window", [None, 2])
+def test_state_snapshot(
+    annotated_utterance: AnnotatedUtterance, history_window: Optional[int]
+) -> None:
+    """Test that states are not affected by later updates.
+
+    Args:
+        annotated_utterance: Annotated utterance.
+        history_window: History window of the tracker.
+    """
+    tracker = DialogueStateTracker(history_window=history_window)
+    tracker.update(annotated_utterance)
+    state = tracker.get_state()
+    for _ in range(2):
+        tracker.update(annotated_utterance)
+
+    assert state.turn_count == 1
+    assert state.history == [annotated_utterance]
+    assert state.history[-2:] == [annotated_utterance]
+    assert list(state.history) == [annotated_utterance]
+    with pytest.raises(IndexError):
+        state.history[1]
+    assert state.slots == {"name": (Annotation("name", "John"),)}
+    assert len(tracker.get_state().slots["name"]) == 3
+
+
+def test_state_copy(annotated_utterance: AnnotatedUtterance) -> None:
+    """Test that states can be copied, pickled and converted to a dict.
+
+    Args:
+        annotated_utterance: Annotated utterance.
+    """
+    tracker = DialogueStateTracker()
+    tracker.update(annotated_utterance)
+    tracker.update(annotated_utterance)
+    state = tracker.get_state()
+    assert copy.deepcopy(state) == state
+    assert pickle.loads(pickle.dumps(state)) == state
+
+    state_dict = asdict(state)
+    assert state_dict["history"] == [annotated_utterance] * 2
+    assert state_dict["slots"] == {
+        "name": (Annotation("name", "John"), Annotation("name", "John"))
+    }
+
+
+def test_version(annotated_utterance: AnnotatedUtterance) -> None:
+    """Test that the state version is incremented on every update.
+
+    Args:
+        annotated_utterance: Annotated utterance.
+    """
+    tracker = DialogueStateTracker()
+    assert tracker.get_state().version == 0
+
+    agent_utterance = AnnotatedUtterance(
+        "Hi, how can I assist you?",
+        DialogueParticipant.AGENT,
+        intent=Intent("offer_help"),
+    )
+    tracker.update(annotated_utterance)
+    tracker.update(agent_utterance)
+    assert tracker.get_state().version == 2
+
+
+def test_update_multiple_slots() -> None:
+    """Test that annotations are added to their slots in order."""
+    tracker = DialogueStateTracker()
+    tracker.update(
+        AnnotatedUtterance(
+            "I like action and fantasy movies with Tom Cruise",
+            DialogueParticipant.USER,
+            intent=Intent("disclose"),
+            annotations=[
+                Annotation("genre", "action"),
+                Annotation("genre", "fantasy"),
+                Annotation("actor", "Tom Cruise"),
+            ],
+        )
+    )
+    tracker.update(
+        AnnotatedUtterance(
+            "Maybe also comedy",
+            DialogueParticipant.USER,
+            intent=Intent("disclose"),
+            annotations=[Annotation("genre", "comedy")],
+        )
+    )
+    assert tracker.get_state().slots == {
+        "genre": (
+            Annotation("genre", "action"),
+            Annotation("genre", "fantasy"),
+            Annotation("genre", "comedy"),
+        ),
+        "actor": (Annotation("actor", "Tom Cruise"),),
+    }
+    assert tracker.get_state().get_slot_values("genre") == [
+        "action",
+        "fantasy",
+        "comedy",
+    ]
+    assert tracker.get_state().get_slot_values("title") == []
+    assert "title" not in tracker.get_state().slots
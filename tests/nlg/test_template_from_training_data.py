@@ -1,10 +1,14 @@
 """Tests for extracting templates from training data."""
 
+import pytest
+
 from dialoguekit.core import AnnotatedUtterance, Annotation, Intent
+from dialoguekit.nlg import template_from_training_data
 from dialoguekit.nlg.template_from_training_data import (
     _replace_slot_with_placeholder,
     build_template_from_instances,
     extract_utterance_template,
+    extract_utterance_templates,
 )
 from dialoguekit.nlu import SatisfactionClassifierSVM
 from dialoguekit.participant import DialogueParticipant
@@ -170,14 +174,24 @@ def test_replace_slot_with_placeholder():
         text="How about old street?", participant=DialogueParticipant.AGENT
     )
     a2.add_annotations([Annotation(slot="TITLE", value="old street")])
+    a3 = AnnotatedUtterance(
+        text="I liked The Matrix Reloaded and The Matrix.",
+        participant=DialogueParticipant.AGENT,
+    )
+    a3.add_annotations([Annotation(slot="TITLE", value="The Matrix")])
+    a3.add_annotations([Annotation(slot="TITLE", value="The Matrix Reloaded")])
     annotated_utterances = [
         (a1, "I like {GENRE} or {GENRE} movies."),
         (a2, "How about {TITLE}?"),
+        (a3, "I liked {TITLE} and {TITLE}."),
     ]
 
     for utterance, expected_text in annotated_utterances:
         _replace_slot_with_placeholder(utterance)
         assert utterance.text == expected_text
+        assert all(
+            annotation.value is None for annotation in utterance.annotations
+        )
 
 
 def test_extract_utterance_template():
@@ -217,6 +231,74 @@ def test_extract_utterance_template():
     assert templates.get(Intent("REVEAL.EXPAND")) == [test_annotation]
 
 
+def test_extract_utterance_templates_multiple_files():
+    """Tests that templates from multiple files are merged per intent."""
+    templates = extract_utterance_template(ANNOTATED_DIALOGUE_FILE)
+    merged_templates = extract_utterance_templates(
+        [ANNOTATED_DIALOGUE_FILE, ANNOTATED_DIALOGUE_FILE]
+    )
+
+    assert merged_templates.keys() == templates.keys()
+    for intent, utterances in templates.items():
+        assert set(merged_templates[intent]) == set(utterances)
+
+
+def test_extract_utterance_template_stream():
+    """Tests that streaming extraction gives the same templates."""
+    pytest.importorskip("ijson")
+    templates = extract_utterance_template(ANNOTATED_DIALOGUE_FILE)
+    streamed_templates = extract_utterance_template(
+        ANNOTATED_DIALOGUE_FILE, stream=True
+    )
+
+    assert streamed_templates.keys() == templates.keys()
+    for intent, utterances in templates.items():
+        assert set(streamed_templates[intent]) == set(utterances)
+
+
+def test_extract_utterance_template_stream_lazy(monkeypatch):
+    """Tests that streamed dialogues are processed as they are parsed."""
+    pytest.importorskip("ijson")
+    events = []
+    iter_json_file_items = template_from_training_data._iter_json_file_items
+    extract_dialogue_templates = (
+        template_from_training_data._extract_dialogue_templates
+    )
+
+    def _iter_items(path):
+        for item in iter_json_file_items(path):
+            events.append("parse")
+            yield item
+
+    def _extract(*args):
+        events.append("extract")
+        extract_dialogue_templates(*args)
+
+    monkeypatch.setattr(
+        template_from_training_data, "_iter_json_file_items", _iter_items
+    )
+    monkeypatch.setattr(
+        template_from_training_data, "_extract_dialogue_templates", _extract
+    )
+    extract_utterance_template(ANNOTATED_DIALOGUE_FILE, stream=True)
+
+    assert len(events) > 2
+    assert events[:2] == ["parse", "extract"]
+
+
+def test_extract_utterance_template_parallel(monkeypatch):
+    """Tests that extraction with worker processes gives the same templates."""
+    monkeypatch.setattr(template_from_training_data, "_DIALOGUE_CHUNK_SIZE", 1)
+    templates = extract_utterance_template(ANNOTATED_DIALOGUE_FILE)
+    parallel_templates = extract_utterance_template(
+        ANNOTATED_DIALOGUE_FILE, num_workers=2
+    )
+
+    assert parallel_templates.keys() == templates.keys()
+    for intent, utterances in templates.items():
+        assert set(parallel_templates[intent]) == set(utterances)
+
+
 def test_extract_utterance_template_with_satisfaction():
     """Tests tempalte generation with satisfaction."""
     templates = extract_utterance_template(
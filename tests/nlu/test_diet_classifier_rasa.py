@@ -3,9 +3,14 @@
 import pytest
 
 from dialoguekit.core import Intent, Utterance
-from dialoguekit.nlu import IntentClassifierRasa
 from dialoguekit.participant import DialogueParticipant
 
+pytest.importorskip("rasa")
+
+from dialoguekit.nlu.models.diet_classifier_rasa import (  # noqa: E402
+    IntentClassifierRasa,
+)
+
 PLACEHOLDER = "(.*)"
 
 
@@ -1,13 +1,23 @@
 """Test the classes in flask_socket_platform.py."""
 
+import json
+from dataclasses import asdict, dataclass, field
+from typing import Any, List
 from unittest import mock
 
 import pytest
 
 from dialoguekit.core import AnnotatedUtterance, Intent, Utterance
 from dialoguekit.participant import DialogueParticipant
-from dialoguekit.platforms import FlaskSocketPlatform
-from dialoguekit.platforms.flask_socket_platform import ChatNamespace, Message
+from dialoguekit.platforms import FlaskSocketPlatform, flask_socket_platform
+from dialoguekit.platforms.flask_socket_platform import (
+    ChatNamespace,
+    Message,
+    _article_to_dict,
+    flush_study_data,
+    load_study_data,
+    save_study_data,
+)
 from sample_agents import ParrotAgent
 
 
@@ -63,6 +73,129 @@ def test_message_from_annotated_utterance():
     assert annotated_message.intent == intent
 
 
+def test_message_from_annotated_utterance_without_intent():
+    """Test that a Message from an AnnotatedUtterance may lack an intent."""
+    annotated_utterance = AnnotatedUtterance(
+        "Hello, world!", DialogueParticipant.AGENT
+    )
+
+    annotated_message = Message.from_utterance(annotated_utterance)
+
+    assert annotated_message.intent is None
+
+
+@dataclass
+class Article:
+    id: str
+    tags: List[str] = field(default_factory=list)
+
+
+@dataclass
+class ScoredArticle:
+    article: Article
+    score: float
+
+
+def test_article_to_dict():
+    """Test that articles are converted to dictionaries like asdict."""
+    article = Article("a1", ["news"])
+    scored_article = ScoredArticle(article, 0.5)
+
+    assert _article_to_dict(article) == {"id": "a1", "tags": ["news"]}
+    assert _article_to_dict(scored_article) == {
+        "article": {"id": "a1", "tags": ["news"]},
+        "score": 0.5,
+    }
+
+
+@dataclass
+class ArticleList:
+    articles: List[Article]
+    info: Any = None
+
+
+def test_article_to_dict_nested_fields():
+    """Test that dataclasses nested in container or Any fields are
+    converted."""
+    article = Article("a1", ["news"])
+
+    assert _article_to_dict(ArticleList([article], article)) == {
+        "articles": [{"id": "a1", "tags": ["news"]}],
+        "info": {"id": "a1", "tags": ["news"]},
+    }
+
+
+@dataclass
+class RankedArticle:
+    id: str
+    _score: float
+
+
+@mock.patch("flask_socketio.SocketIO.emit")
+def test_provide_recommendations(emit, platform):
+    """Test that articles are emitted as the JSON of their asdict."""
+    article = RankedArticle("a1", 0.5)
+
+    platform.provide_recommendations("test_user_id", [article])
+    emit.assert_called_once_with(
+        "recommendations",
+        [json.loads(json.dumps(asdict(article)))],
+        room="test_user_id",
+    )
+
+
+@pytest.fixture
+def study_file(tmp_path, monkeypatch):
+    """Point the study data at a temporary file with an empty cache."""
+    study_path = tmp_path / "study.json"
+    study_path.write_text(json.dumps({"stage": 1}))
+    monkeypatch.setattr(flask_socket_platform, "_STUDY_PATH", str(study_path))
+    monkeypatch.setattr(flask_socket_platform, "_study_cache", None)
+    yield study_path
+    flush_study_data()
+
+
+def test_load_study_data_cached(study_file):
+    """Test that the study file is only read on the first load."""
+    assert load_study_data() == {"stage": 1}
+    study_file.write_text(json.dumps({"stage": 2}))
+    assert load_study_data() == {"stage": 1}
+
+
+def test_save_study_data(study_file):
+    """Test that saved study data is written to disk as of the save."""
+    data = {"stage": 2}
+    save_study_data(data)
+    data["stage"] = 3
+    assert load_study_data() == {"stage": 3}
+
+    flush_study_data()
+    assert json.loads(study_file.read_text()) == {"stage": 2}
+    assert [path.name for path in study_file.parent.iterdir()] == ["study.json"]
+
+
+def test_save_study_data_error(study_file, monkeypatch):
+    """Test that write errors are raised when flushing the study data."""
+    monkeypatch.setattr(
+        flask_socket_platform,
+        "_STUDY_PATH",
+        str(study_file.parent / "missing" / "study.json"),
+    )
+    save_study_data({"stage": 2})
+
+    with pytest.raises(FileNotFoundError):
+        flush_study_data()
+    flush_study_data()
+
+
+def test_save_study_data_non_str_keys(study_file):
+    """Test that study data with non-string keys is saved like json.dump."""
+    save_study_data({"stage": 2, 1: "done"})
+
+    flush_study_data()
+    assert json.loads(study_file.read_text()) == {"stage": 2, "1": "done"}
+
+
 @mock.patch("flask_socketio.SocketIO.run")
 def test_platform_start(mock_run, platform):
     """Test that the platform starts the server."""
@@ -0,0 +1,182 @@
+"""Test the Platform base class."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+from dialoguekit.core import Utterance
+from dialoguekit.core.feedback import BinaryFeedback
+from dialoguekit.participant import Agent
+from dialoguekit.platforms import Platform
+from dialoguekit.platforms import platform as platform_module
+
+
+class DummyAgent(Agent):
+    def welcome(self) -> None:
+        """Sends the agent's welcome message."""
+
+    def goodbye(self) -> None:
+        """Sends the agent's goodbye message."""
+
+    def receive_utterance(self, utterance: Utterance) -> None:
+        """Receives an utterance."""
+
+    def handle_recommendation_feedback(self, item_id: str, value: int) -> None:
+        """Handles recommendation feedback."""
+
+
+class DummyPlatform(Platform):
+    def start(self) -> None:
+        """Starts the platform."""
+
+    def display_agent_utterance(
+        self, user_id: str, utterance: Utterance
+    ) -> None:
+        """Displays an agent utterance."""
+
+    def display_user_utterance(
+        self, user_id: str, utterance: Utterance
+    ) -> None:
+        """Displays a user utterance."""
+
+
+@pytest.fixture
+def platform() -> DummyPlatform:
+    """Platform fixture."""
+    return DummyPlatform(DummyAgent)
+
+
+def test_connect(platform: DummyPlatform) -> None:
+    """Test that connecting creates a dialogue connector for the user."""
+    platform.connect("user1")
+    dialogue_connector = platform.get_dialogue_connector("user1")
+
+    assert dialogue_connector is not None
+    assert platform.get_user("user1") is dialogue_connector.user
+    assert platform.get_user("user1").id == "user1"
+    assert platform.get_agent("user1") is dialogue_connector.agent
+    assert isinstance(platform.get_agent("user1"), DummyAgent)
+    assert platform.get_agent("user1").id == "DummyAgent"
+    assert platform.get_dialogue_connector("user2") is None
+
+
+def test_disconnect(platform: DummyPlatform) -> None:
+    """Test that disconnecting removes the user's dialogue connector."""
+    platform.connect("user1")
+    platform.disconnect("user1")
+
+    assert platform.get_dialogue_connector("user1") is None
+    with pytest.raises(KeyError):
+        platform.get_user("user1")
+    with pytest.raises(KeyError):
+        platform.disconnect("user1")
+
+
+def test_connect_copies_active_connections(platform: DummyPlatform) -> None:
+    """Test that connecting and disconnecting do not modify earlier
+    snapshots of the active connections."""
+    platform.connect("user1")
+    active_connections = platform._active_connections
+    platform.connect("user2")
+    platform.disconnect("user1")
+
+    assert list(active_connections) == ["user1"]
+    assert list(platform._active_connections) == ["user2"]
+
+
+def test_message(platform: DummyPlatform) -> None:
+    """Test that messages are passed to the connected user."""
+    platform.connect("user1")
+    user = platform.get_user("user1")
+    with mock.patch.object(user, "handle_input") as handle_input:
+        platform.message("user1", "Hello", {"key": "value"})
+        platform.message("user1", "Hi")
+
+    assert handle_input.call_args_list == [
+        mock.call("Hello", {"key": "value"}),
+        mock.call("Hi", None),
+    ]
+    with pytest.raises(KeyError):
+        platform.message("user2", "Hello", {})
+
+
+def test_feedback(platform: DummyPlatform) -> None:
+    """Test that feedback is recorded in the dialogue history."""
+    platform.connect("user1")
+    platform.feedback("user1", "utterance1", 1)
+    platform.feedback("user1", "utterance2", 0)
+    dialogue = platform.get_dialogue_connector("user1").dialogue_history
+
+    assert (
+        dialogue.get_utterance_feedback("utterance1").feedback
+        == BinaryFeedback.POSITIVE
+    )
+    assert (
+        dialogue.get_utterance_feedback("utterance2").feedback
+        == BinaryFeedback.NEGATIVE
+    )
+    with pytest.raises(KeyError):
+        platform.feedback("user2", "utterance1", 1)
+
+
+def test_feedback_batch(platform: DummyPlatform) -> None:
+    """Test that a batch of feedback is recorded in the dialogue history."""
+    platform.connect("user1")
+    platform.feedback_batch("user1", [("utterance1", 1), ("utterance2", 0)])
+    dialogue = platform.get_dialogue_connector("user1").dialogue_history
+
+    assert (
+        dialogue.get_utterance_feedback("utterance1").feedback
+        == BinaryFeedback.POSITIVE
+    )
+    assert (
+        dialogue.get_utterance_feedback("utterance2").feedback
+        == BinaryFeedback.NEGATIVE
+    )
+    with pytest.raises(KeyError):
+        platform.feedback_batch("user2", [])
+
+
+def test_concurrent_connections(platform: DummyPlatform) -> None:
+    """Test that users can connect and disconnect from several threads."""
+    user_ids = [f"user{i}" for i in range(100)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(platform.connect, user_ids))
+
+    assert all(platform.get_user(user_id).id == user_id for user_id in user_ids)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(platform.disconnect, user_ids))
+
+    assert all(
+        platform.get_dialogue_connector(user_id) is None for user_id in user_ids
+    )
+
+
+def test_abstract_methods() -> None:
+    """Test that platforms must implement all abstract methods."""
+    with pytest.raises(TypeError):
+
+        class IncompletePlatform(Platform):
+            def start(self) -> None:
+                """Starts the platform."""
+
+    with pytest.raises(TypeError):
+        Platform(DummyAgent)
+
+
+def test_invalid_agent_class() -> None:
+    """Test that agent classes must subclass Agent and are not remembered
+    otherwise."""
+    with pytest.raises(ValueError):
+        DummyPlatform(object)
+    with pytest.raises(ValueError):
+        DummyPlatform(object)
+    assert object not in platform_module._verified_agent_classes
+
+
+def test_verified_agent_class(platform: DummyPlatform) -> None:
+    """Test that agent classes are remembered once verified."""
+    assert DummyAgent in platform_module._verified_agent_classes
+    assert DummyPlatform(DummyAgent)._agent_class is DummyAgent
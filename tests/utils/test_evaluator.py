@@ -12,7 +12,7 @@ from dialoguekit.utils import Evaluator
 from dialoguekit.utils.dialogue_reader import json_to_dialogues
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def annotated_dialogues() -> List[Dialogue]:
     """Test dialogue fixture."""
     export_dialogues = json_to_dialogues(
@@ -21,7 +21,7 @@ def annotated_dialogues() -> List[Dialogue]:
     return export_dialogues
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def reward_config() -> Dict[str, Any]:
     """Test reward config."""
     _REWARD_CONFIG = {
@@ -38,7 +38,7 @@ def reward_config() -> Dict[str, Any]:
     return _REWARD_CONFIG
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def satisfaction_classifier() -> SatisfactionClassifierSVM:
     """Tests satisfaction classifier init.
 
@@ -73,6 +73,7 @@ def test_avg_turns(
     assert avg_turns == pytest.approx(16.33, 0.1)
     avg_turns2 = ev.avg_turns()
     assert avg_turns2 == pytest.approx(16.33, 0.1)
+    assert len(ev._dialogue_lengths) == len(annotated_dialogues)
 
 
 def test_user_act_ratio(
@@ -92,6 +93,9 @@ def test_user_act_ratio(
     assert stats.get("USER") == 50
     assert stats.get("USER/AGENT") == pytest.approx(0.84, 0.1)
 
+    stats["USER"] = 0
+    assert ev.user_act_ratio().get("USER") == 50
+
 
 def test_reward(
     annotated_dialogues: List[Dialogue], reward_config: Dict[str, Any]